@@ -3,11 +3,23 @@
 from account import Account, Suite
 from elements import Value, Element, Segment
 from query import Query
+from transport import HTTPTransport, RecordingTransport, ReplayTransport
 from reports import InvalidReportError, Report, OverTimeReport, \
     RankedReport, TrendedReport, DataWarehouseReport
+import utils
 
+# report sets are optional, as they require numpy, but any 
+# other problem importing them should not go unnoticed
+try:
+    import numpy
+except ImportError:
+    pass
+else:
+    del numpy
+    from reportset import ReportSet
 
-def authenticate(username, secret=None, endpoint=Account.DEFAULT_ENDPOINT, prefix='', suffix=''):
+
+def authenticate(username, secret=None, endpoint=Account.DEFAULT_ENDPOINT, prefix='', suffix='', transport=None):
     # if no secret is specified, we will assume that instead 
     # we have received a dictionary with credentials (such as
     # from os.environ)
@@ -18,7 +30,7 @@ def authenticate(username, secret=None, endpoint=Account.DEFAULT_ENDPOINT, prefi
         username = source[key_to_username]
         secret = source[key_to_secret]
 
-    return Account(username, secret, endpoint)
+    return Account(username, secret, endpoint, transport)
 
 
 def queue(queries):
@@ -29,11 +41,15 @@ def queue(queries):
         query.queue()
 
 
-def sync(queries, heartbeat=None, interval=1):
+def sync(queries, heartbeat=None, interval=1, combine=False):
     """
     `omniture.sync` will queue a number of reports and then 
     block until the results are ready.
 
+    With `combine=True`, the reports are returned as a `ReportSet`
+    (labeled with the dictionary keys, if you passed a dictionary)
+    which makes it easy to compare them to each other.
+
     Queueing reports is idempotent, meaning that you can also 
     use `omniture.sync` to fetch the results for queries that 
     have already been queued: 
@@ -46,8 +62,16 @@ def sync(queries, heartbeat=None, interval=1):
     queue(queries)
 
     if isinstance(queries, list):
-        return [query.sync(heartbeat, interval) for query in queries]
+        reports = [query.sync(heartbeat, interval) for query in queries]
+        if combine:
+            from reportset import ReportSet
+            return ReportSet(reports)
+        return reports
     elif isinstance(queries, dict):
+        if combine:
+            from reportset import ReportSet
+            labels = queries.keys()
+            return ReportSet([queries[key].sync(heartbeat, interval) for key in labels], labels)
         return {key: query.sync(heartbeat, interval) for key, query in queries.items()}
     else:
         message = "Queries should be a list or a dictionary, received: {}".format(
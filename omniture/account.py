@@ -1,11 +1,10 @@
-import requests
 import binascii
 import time
 import sha
-import json
 from datetime import datetime
 from elements import Value, Element, Segment
 from query import Query
+from transport import HTTPTransport
 import utils
 
 # encoding: utf-8
@@ -13,22 +12,17 @@ import utils
 class Account(object):
     DEFAULT_ENDPOINT = 'https://api.omniture.com/admin/1.3/rest/'
 
-    def __init__(self, username, secret, endpoint=DEFAULT_ENDPOINT):
+    def __init__(self, username, secret, endpoint=DEFAULT_ENDPOINT, transport=None):
         self.username = username
         self.secret = secret
         self.endpoint = endpoint
+        self.transport = transport or HTTPTransport()
         data = self.request('Company', 'GetReportSuites')['report_suites']
         suites = [Suite(suite['site_title'], suite['rsid'], self) for suite in data]
         self.suites = utils.AddressableList(suites)
 
     def request(self, api, method, query={}):
-        response = requests.post(
-            self.endpoint, 
-            params={'method': api + '.' + method}, 
-            data=json.dumps(query), 
-            headers=self._build_token()
-            )
-        return response.json()
+        return self.transport.request(self, api, method, query)
 
     def _serialize_header(self, properties):
         header = []
@@ -59,7 +53,11 @@ class Suite(Value):
         raw_query = {}
         raw_query.update(query)
         if 'reportDescription' in raw_query:
-            raw_query['reportDescription']['reportSuiteID'] = self.id
+            # queries cache their build output, so we make sure
+            # not to modify the report description in place
+            description = dict(raw_query['reportDescription'])
+            description['reportSuiteID'] = self.id
+            raw_query['reportDescription'] = description
         elif api == 'ReportSuite':
             raw_query['rsid_list'] = [self.id]
 
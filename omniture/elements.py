@@ -23,7 +23,10 @@ class Value(object):
         return "<{title}: {id} in {parent}>".format(**self.__dict__)
 
     def copy(self):
-        value = self.__class__(self.title, self.id, self.parent)
+        # skip `__init__`: copies share everything with the original 
+        # except for their properties
+        value = self.__class__.__new__(self.__class__)
+        value.__dict__.update(self.__dict__)
         value.properties = copy(self.properties)
         return value
 
@@ -1,14 +1,23 @@
 # encoding: utf-8
 
 import time
+import json
 from copy import copy
 import functools
+import itertools
+from collections import deque
 from dateutil.relativedelta import relativedelta
 from elements import Value, Element, Segment
 import reports
 import utils
 
 
+# Queries are never modified in place: every builder method works on
+# a fresh clone. The clone shares all of its values with the original
+# and only gets its own (shallow) `raw` dictionary, so chaining costs
+# a handful of key assignments rather than a deep copy, and anything
+# derived from the query's state (see `build` and `canonical`) can
+# safely be cached on the instance.
 def immutable(method):
     @functools.wraps(method)
     def wrapped_method(self, *vargs, **kwargs):
@@ -21,12 +30,16 @@ def immutable(method):
 
 class Query(object):
     GRANULARITY_LEVELS = ['hour', 'day', 'month']
+    # the most rows the API will return for a ranked report
+    MAX_ROWS = 50000
 
     def __init__(self, suite):
         self.suite = suite
         self.raw = {}
         self.id = None
         self.report = None
+        self._built = None
+        self._canonical = None
 
     def _normalize_value(self, value, category):
         if isinstance(value, Value):
@@ -52,9 +65,13 @@ class Query(object):
             return obj
 
     def clone(self):
-        query = Query(self.suite)
+        query = Query.__new__(Query)
+        query.suite = self.suite
         query.raw = copy(self.raw)
+        query.id = None
         query.report = self.report
+        query._built = None
+        query._canonical = None
         return query
 
     @immutable
@@ -160,6 +177,11 @@ class Query(object):
         return self
 
     def build(self):
+        if self._built is None:
+            self._built = self._build()
+        return self._built
+
+    def _build(self):
         if self.report == reports.DataWarehouseReport:
             return utils.translate(self.raw, {
                 'metrics': 'Metric_List',
@@ -173,6 +195,34 @@ class Query(object):
         else:
             return {'reportDescription': self.raw}
 
+    def canonical(self):
+        """
+        A canonical string representation of the query: two queries
+        that would result in the same API request have the same
+        canonical form, regardless of how they were built up.
+        Queries hash and compare by this representation, so they 
+        can be used to deduplicate work or as cache keys.
+        """
+
+        if self._canonical is None:
+            method = self.report and self.report.method
+            self._canonical = json.dumps([method, self.build()], sort_keys=True)
+        return self._canonical
+
+    def __eq__(self, other):
+        if not isinstance(other, Query):
+            return NotImplemented
+        return self.suite is other.suite and self.canonical() == other.canonical()
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+        return not equal
+
+    def __hash__(self):
+        return hash(self.canonical())
+
     def queue(self):
         q = self.build()
         self.id = self.suite.request('Report', self.report.method, q)['reportID']
@@ -205,6 +255,85 @@ class Query(object):
         response = self.probe(get_report, heartbeat, interval)
         return self.report(response, self)
 
+    @immutable
+    def _window(self, start, top):
+        elements = list(self.raw['elements'])
+        element = dict(elements[0])
+        element['startingWith'] = str(start)
+        element['top'] = str(top)
+        elements[0] = element
+        self.raw['elements'] = elements
+        return self
+
+    def _windows(self, start, stop, size):
+        offset = start
+        while stop is None or offset < stop:
+            if stop is None:
+                top = size
+            else:
+                top = min(size, stop - offset)
+            yield self._window(offset, top), top
+            offset = offset + top
+
+    # only for ranked reports
+    def iter_rows(self, size=100, prefetch=2, heartbeat=None, interval=1):
+        """
+        Iterate over all rows of a ranked report, no matter how
+        many values the (first) element has, by requesting it in
+        windows of `size` rows, starting at the element's 
+        `startingWith` (or the first row). If the element has a
+        `top` (e.g. from `Element.range`), iteration stops after 
+        that many rows.
+
+        Before the first window is synced, it and the next 
+        `prefetch` windows are queued. Whenever you're done with
+        a window, one more gets queued, so while you go through 
+        a window, the next `prefetch` windows are pending. Use 
+        `prefetch=0` to only queue a window once you need it.
+
+        Iteration ends at the first window that is not full, so
+        `size` cannot be larger than the number of rows the API 
+        will return for a single report (`Query.MAX_ROWS`).
+        """
+
+        if self.report != reports.RankedReport:
+            raise ValueError("Can only iterate over the rows of ranked reports.")
+        if not 0 < size <= self.MAX_ROWS:
+            raise ValueError("Size should be between 1 and {}, received: {}".format(
+                self.MAX_ROWS, size))
+
+        element = self.raw['elements'][0]
+        # the API counts rows from 1, but `Element.range(stop)` 
+        # starts at 0, which amounts to the same thing
+        start = max(int(element.get('startingWith', 1)), 1)
+        if 'top' in element:
+            stop = start + int(element['top'])
+        else:
+            stop = None
+        windows = self._windows(start, stop, size)
+
+        pending = deque()
+        try:
+            for query, top in itertools.islice(windows, prefetch + 1):
+                pending.append((query.queue(), top))
+
+            while pending:
+                query, top = pending.popleft()
+                report = query.sync(heartbeat, interval)
+                for row in report:
+                    yield row
+
+                # a window that is not full is the last one
+                if report.count < top:
+                    break
+
+                for query, top in itertools.islice(windows, 1):
+                    pending.append((query.queue(), top))
+        finally:
+            # cancel whatever was prefetched but is no longer needed
+            for query, top in pending:
+                query.cancel()
+
     # only for SiteCatalyst queries
     def async(self, callback=None, heartbeat=None, interval=1):
         if not self.id:
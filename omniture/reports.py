@@ -27,7 +27,6 @@ class InvalidReportError(Exception):
         super(InvalidReportError, self).__init__(message)
 
 
-#  TODO: also make this iterable (go through rows)
 class Report(object):
     def process(self):
         self.status = self.raw['status']
@@ -45,6 +44,9 @@ class Report(object):
         else:
             self.segment = None
 
+        # `keys` holds the period or element name for every row, 
+        # in the same order as the values in `data`
+        self.keys = []
         self.data = utils.AddressableDict(self.metrics)
         for column in self.data:
             column.value = []
@@ -66,6 +68,21 @@ class Report(object):
             d[key] = el.value
         return d
 
+    def __iter__(self):
+        # rows are dictionaries with the period or element name
+        # and a value for every metric, keyed by metric id
+        ids = [metric.id for metric in self.metrics]
+        columns = [column.value for column in self.data]
+        for i, key in enumerate(self.keys):
+            row = {'name': key}
+            for id, column in zip(ids, columns):
+                row[id] = column[i]
+            yield row
+
+    @property
+    def count(self):
+        return len(self.keys)
+
     def __init__(self, raw, query):
         #from pprint import pprint
         #pprint(raw)
@@ -89,7 +106,13 @@ class OverTimeReport(Report):
         # TODO: this works for over_time reports and I believe for ranked
         # reports as well, but trended reports have their data in 
         # `data.breakdown:[breakdown:[counts]]`
+        # the names of periods don't sort chronologically, 
+        # so we also keep track of their dates
+        self.periods = []
         for row in self.report['data']:
+            self.keys.append(row['name'])
+            period = tuple(row[key] for key in ['year', 'month', 'day', 'hour'] if key in row)
+            self.periods.append(period or row['name'])
             for i, value in enumerate(row['counts']):
                 if self.metrics[i].type == 'number':
                     value = float(value)
@@ -102,12 +125,23 @@ class RankedReport(Report):
     def process(self):
         super(RankedReport, self).process()
 
+        self.urls = []
         for row in self.report['data']:
+            self.keys.append(row['name'])
+            self.urls.append(row['url'])
             for i, value in enumerate(row['counts']):
                 if self.metrics[i].type == 'number':
                     value = float(value)
                 self.data[i].append((row['name'], row['url'], value))
 
+    def __iter__(self):
+        for i, row in enumerate(super(RankedReport, self).__iter__()):
+            for metric in self.metrics:
+                name, url, value = row[metric.id]
+                row[metric.id] = value
+            row['url'] = self.urls[i]
+            yield row
+
 RankedReport.method = 'QueueRanked'
 
 
@@ -0,0 +1,156 @@
+# encoding: utf-8
+
+import itertools
+import numpy as np
+from reports import OverTimeReport, RankedReport
+
+
+class ReportSet(object):
+    """
+    A number of reports, aligned on their periods (for over time
+    reports) or element values (for ranked reports), so they can be
+    compared and combined without having to loop over the data.
+
+    For every metric, `values` gives a two-dimensional array with one
+    row per report and one column per key, with `nan` where a report
+    has no data for a key. The keys themselves are in `keys`: period
+    names for over time reports, `(name, url)` pairs for ranked
+    reports. Most methods take an `axis` argument that
+    works the same way as in numpy: `axis=0` combines the reports for
+    every key, `axis=1` combines the keys for every report.
+    """
+
+    def __init__(self, reports, labels=None):
+        self.reports = list(reports)
+        if labels is None:
+            labels = range(len(self.reports))
+        self.labels = list(labels)
+
+        alignments = [self._alignment(report) for report in self.reports]
+        for report, alignment in zip(self.reports, alignments):
+            if len(set(alignment)) < len(alignment):
+                raise ValueError("Cannot align {report}: it has more than one row for the same key.".format(
+                    report=report))
+
+        seen = set()
+        keys = []
+        for key in itertools.chain(*alignments):
+            if key not in seen:
+                seen.add(key)
+                keys.append(key)
+        # periods are ordered chronologically, so period-over-period
+        # changes make sense even when reports cover different ranges
+        if all(isinstance(report, OverTimeReport) for report in self.reports):
+            keys.sort()
+
+        index = dict((key, i) for i, key in enumerate(keys))
+        self.positions = []
+        self.keys = np.empty(len(keys), dtype=object)
+        for report, alignment in zip(self.reports, alignments):
+            positions = np.array([index[key] for key in alignment], dtype=int)
+            self.positions.append(positions)
+            if isinstance(report, RankedReport):
+                names = alignment
+            else:
+                names = report.keys
+            # assign one by one, so numpy doesn't unpack tuples
+            for position, name in zip(positions, names):
+                self.keys[position] = name
+        self.matrices = {}
+
+    def _alignment(self, report):
+        # ranked reports can have several rows with the same name, 
+        # for example pages that share a title
+        if isinstance(report, RankedReport):
+            return zip(report.keys, report.urls)
+        elif isinstance(report, OverTimeReport):
+            return report.periods
+        else:
+            return report.keys
+
+    def _column(self, report, metric):
+        column = report.data[metric]
+        if isinstance(report, RankedReport):
+            column = [value for name, url, value in column]
+        return np.array(column, dtype=float)
+
+    def values(self, metric):
+        if metric not in self.matrices:
+            matrix = np.empty((len(self.reports), len(self.keys)))
+            matrix.fill(np.nan)
+            for i, report in enumerate(self.reports):
+                matrix[i, self.positions[i]] = self._column(report, metric)
+            # derived results should never be able to change the cache
+            matrix.setflags(write=False)
+            self.matrices[metric] = matrix
+
+        return self.matrices[metric]
+
+    def sum(self, metric, axis=0):
+        return np.nansum(self.values(metric), axis=axis)
+
+    def ratio(self, numerator, denominator):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return self.values(numerator) / self.values(denominator)
+
+    def share(self, metric, axis=0):
+        """
+        Each value as a fraction of the total: with `axis=0`, how
+        a key's total is divided between reports (e.g. segments),
+        with `axis=1`, how a report's total is divided between keys.
+        """
+
+        values = self.values(metric)
+        totals = np.expand_dims(np.nansum(values, axis=axis), axis)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return values / totals
+
+    def top(self, metric, n=10):
+        """
+        The `n` highest-valued keys in every report, as a tuple of
+        two arrays with one row per report: the keys and their values.
+        Missing values sort last.
+        """
+
+        values = self.values(metric)
+        # negate so that argsort gives us descending order
+        # while still putting nan at the end
+        order = np.argsort(-values, axis=1, kind='mergesort')[:, :n]
+        rows = np.arange(len(self.reports))[:, np.newaxis]
+        return self.keys[order], values[rows, order]
+
+    def change(self, metric, periods=1, relative=False):
+        """
+        Period-over-period change for every report, that is, the
+        difference between every value and the value `periods` keys
+        earlier. The first `periods` columns are `nan`. With
+        `relative=True`, the change is expressed as a fraction of
+        the earlier value.
+        """
+
+        if periods < 1:
+            raise ValueError("Periods should be a positive number, received: {}".format(periods))
+
+        values = self.values(metric)
+        change = np.empty(values.shape)
+        change.fill(np.nan)
+        if periods < values.shape[1]:
+            previous = values[:, :-periods]
+            change[:, periods:] = values[:, periods:] - previous
+            if relative:
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    change[:, periods:] /= previous
+        return change
+
+    def __getitem__(self, label):
+        return self.reports[self.labels.index(label)]
+
+    def __iter__(self):
+        return iter(self.reports)
+
+    def __len__(self):
+        return len(self.reports)
+
+    def __repr__(self):
+        return "<omniture.ReportSet ({reports} reports) ({keys} keys)>".format(
+            reports=len(self.reports), keys=len(self.keys))
@@ -0,0 +1,124 @@
+# encoding: utf-8
+
+import time
+import json
+import gzip
+import requests
+from collections import defaultdict
+
+
+def canonical(api, method, query):
+    return api + '.' + method, json.dumps(query, sort_keys=True)
+
+
+class HTTPTransport(object):
+    """
+    Talks to the Omniture API over the network. This is what
+    an `Account` uses unless told otherwise.
+    """
+
+    def request(self, account, api, method, query):
+        response = requests.post(
+            account.endpoint,
+            params={'method': api + '.' + method},
+            data=json.dumps(query),
+            headers=account._build_token()
+            )
+        return response.json()
+
+
+class RecordingTransport(object):
+    """
+    Passes requests on to another transport (by default, the
+    network) and writes every exchange to a gzipped archive
+    with one JSON record per line, for later use with
+    `ReplayTransport`.
+
+    The archive is a single compressed stream that stays open
+    until you `close` the transport. An existing archive is 
+    overwritten, unless you pass `append=True`.
+    """
+
+    def __init__(self, path, transport=None, append=False):
+        self.path = path
+        self.transport = transport or HTTPTransport()
+        if append:
+            mode = 'ab'
+        else:
+            mode = 'wb'
+        self.archive = gzip.open(path, mode)
+
+    def request(self, account, api, method, query):
+        start = time.time()
+        response = self.transport.request(account, api, method, query)
+        elapsed = time.time() - start
+
+        method, query = canonical(api, method, query)
+        record = {
+            'method': method,
+            'query': query,
+            'response': response,
+            'elapsed': elapsed,
+            }
+        self.archive.write(json.dumps(record) + '\n')
+
+        return response
+
+    def flush(self):
+        self.archive.flush()
+
+    def close(self):
+        self.archive.close()
+
+
+class ReplayTransport(object):
+    """
+    Serves responses from an archive made with `RecordingTransport`,
+    without touching the network.
+
+    Responses are looked up by method and canonical query. When
+    the same request was recorded more than once (e.g. when polling
+    for report status) the responses are served back in the order
+    they were recorded, after which the last one keeps being
+    repeated.
+
+    `latency` simulates network latency: either a number of seconds
+    to wait for every request, or `'recorded'` to wait as long as
+    the original request took.
+    """
+
+    def __init__(self, path, latency=None):
+        self.path = path
+        self.latency = latency
+        self.index = defaultdict(list)
+        self.cursors = defaultdict(int)
+
+        archive = gzip.open(path, 'rb')
+        try:
+            for line in archive:
+                record = json.loads(line)
+                key = (record['method'], record['query'])
+                self.index[key].append((record['response'], record['elapsed']))
+        finally:
+            archive.close()
+
+    def rewind(self):
+        self.cursors.clear()
+
+    def request(self, account, api, method, query):
+        key = canonical(api, method, query)
+        if key not in self.index:
+            raise KeyError("Cannot find a recorded response for {method} with query {query}".format(
+                method=key[0], query=key[1]))
+
+        exchanges = self.index[key]
+        i = self.cursors[key]
+        response, elapsed = exchanges[min(i, len(exchanges) - 1)]
+        self.cursors[key] = i + 1
+
+        if self.latency == 'recorded':
+            time.sleep(elapsed)
+        elif self.latency:
+            time.sleep(self.latency)
+
+        return response
@@ -9,12 +9,15 @@ setup(name='omniture',
       download_url='http://www.github.com/stdbrouw/python-omniture/tarball/master',
       version='0.3.1',
       license='MIT',
-      packages=find_packages(),
+      packages=find_packages(exclude=['tests']),
       keywords='data analytics api wrapper adobe',
       install_requires=[
             'requests',
             'python-dateutil',
       ],
+      extras_require={
+            'reportset': ['numpy'],
+      },
       classifiers=['Development Status :: 4 - Beta',
                    'Intended Audience :: Developers',
                    'License :: OSI Approved :: MIT License',
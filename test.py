@@ -3,8 +3,21 @@ import sys
 import os
 from pprint import pprint
 
-analytics = omniture.Account()
-analytics.authenticate(os.environ)
+# set OMNITURE_RECORD to a path to record all API traffic to
+# an archive, and OMNITURE_REPLAY to run against that archive 
+# instead of the live API (no credentials needed)
+if 'OMNITURE_REPLAY' in os.environ:
+    analytics = omniture.Account(None, None, 
+        transport=omniture.ReplayTransport(os.environ['OMNITURE_REPLAY']))
+    transport = None
+    interval = 0
+else:
+    if 'OMNITURE_RECORD' in os.environ:
+        transport = omniture.RecordingTransport(os.environ['OMNITURE_RECORD'])
+    else:
+        transport = None
+    analytics = omniture.authenticate(os.environ, transport=transport)
+    interval = 1
 
 #print analytics.suites
 print analytics.suites['guardiangu-parioli-taste-of-rome']
@@ -33,9 +46,11 @@ def heartbeat():
     sys.stdout.write('.')
     sys.stdout.flush()
 
-reports = omniture.sync(queue, heartbeat)
+reports = omniture.sync(queue, heartbeat, interval)
 
 for report in reports:
     print report.segment
     print report.data['pageviews']
 
+if transport:
+    transport.close()
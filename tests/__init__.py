@@ -0,0 +1,33 @@
+# encoding: utf-8
+
+import os
+import atexit
+import omniture
+from fakeapi import FakeAPI
+
+FIXTURE = os.path.join(os.path.dirname(__file__), 'fixtures', 'traffic.json.gz')
+
+# the tests run against recorded traffic, so they need neither
+# credentials nor network access
+if os.environ.get('OMNITURE_RECORD_FIXTURE'):
+    transport = omniture.RecordingTransport(FIXTURE, FakeAPI())
+    atexit.register(transport.close)
+else:
+    transport = omniture.ReplayTransport(FIXTURE)
+
+
+class CountingTransport(object):
+    def __init__(self, transport):
+        self.transport = transport
+        self.methods = []
+
+    def request(self, account, api, method, query):
+        self.methods.append(method)
+        return self.transport.request(account, api, method, query)
+
+
+def account(counting=False):
+    if counting:
+        return omniture.Account(None, None, transport=CountingTransport(transport))
+    else:
+        return omniture.Account(None, None, transport=transport)
@@ -0,0 +1,134 @@
+# encoding: utf-8
+
+"""
+A stand-in for the Omniture API with a small, deterministic
+report suite, used to record the fixture archive the tests
+replay against. To rerecord the fixture after changing this
+file or the tests, run (from the root of the repository):
+
+    OMNITURE_RECORD_FIXTURE=1 python -m unittest discover -s tests -t .
+"""
+
+import json
+import hashlib
+from datetime import date, timedelta
+from dateutil.parser import parse as parse_date
+
+
+METRICS = [
+    {'display_name': 'Page Views', 'metric_name': 'pageviews', 'type': 'number'},
+    {'display_name': 'Visits', 'metric_name': 'visits', 'type': 'number'},
+]
+
+ELEMENTS = [
+    {'display_name': 'Page', 'element_name': 'page'},
+]
+
+SEGMENTS = [
+    {'name': 'UK', 'id': 'uk'},
+    {'name': 'US', 'id': 'us'},
+]
+
+# two pages share a name and only differ by url
+PAGES = [('home', '/')] + [('page {}'.format(i), '/{}'.format(i)) for i in range(1, 35)] + \
+    [('home', '/home')]
+
+
+class FakeAPI(object):
+    def __init__(self, pending=0):
+        # how many times `GetStatus` says a report is not ready yet
+        self.pending = pending
+        self.descriptions = {}
+        self.polls = {}
+
+    def request(self, account, api, method, query):
+        return getattr(self, api + '_' + method)(query)
+
+    def Company_GetReportSuites(self, query):
+        return {'report_suites': [{'site_title': 'Network', 'rsid': 'network'}]}
+
+    def ReportSuite_GetAvailableMetrics(self, query):
+        return [{'available_metrics': METRICS}]
+
+    def ReportSuite_GetAvailableElements(self, query):
+        return [{'available_elements': ELEMENTS}]
+
+    def ReportSuite_GetSegments(self, query):
+        return [{'sc_segments': SEGMENTS}]
+
+    def _queue(self, query):
+        description = query['reportDescription']
+        # identical queries get identical report ids, which
+        # keeps recordings independent of the order of the tests
+        serialized = json.dumps(description, sort_keys=True)
+        id = int(hashlib.sha1(serialized).hexdigest()[:8], 16)
+        self.descriptions[id] = description
+        self.polls[id] = 0
+        return {'reportID': id}
+
+    Report_QueueOvertime = _queue
+    Report_QueueRanked = _queue
+
+    def Report_GetStatus(self, query):
+        id = query['reportID']
+        self.polls[id] += 1
+        if self.polls[id] <= self.pending:
+            return {'status': 'not ready'}
+        else:
+            return {'status': 'ready'}
+
+    def Report_CancelReport(self, query):
+        return True
+
+    def _counts(self, description, i):
+        # different segments get different, but predictable, numbers
+        offset = len(description.get('segment_id', ''))
+        return [str(i + offset), str(i // 2 + offset)]
+
+    def _periods(self, description):
+        if 'date' in description:
+            start = stop = parse_date(description['date']).date()
+        else:
+            start = parse_date(description['dateFrom']).date()
+            stop = parse_date(description['dateTo']).date()
+
+        day = start
+        while day <= stop:
+            yield day
+            day = day + timedelta(days=1)
+
+    def Report_GetReport(self, query):
+        description = self.descriptions[query['reportID']]
+        metrics = [metric['id'] for metric in description['metrics']]
+        elements = description.get('elements', [])
+
+        if elements:
+            element = elements[0]
+            start = max(int(element.get('startingWith', 1)), 1) - 1
+            top = int(element.get('top', 10))
+            data = [{
+                'name': name,
+                'url': url,
+                'counts': self._counts(description, start + i)[:len(metrics)],
+                } for i, (name, url) in enumerate(PAGES[start:start + top])]
+        else:
+            data = [{
+                'name': day.strftime('%a. %d %b %Y'),
+                'year': day.year,
+                'month': day.month,
+                'day': day.day,
+                'counts': self._counts(description, day.day)[:len(metrics)],
+                } for day in self._periods(description)]
+
+        return {
+            'status': 'done',
+            'waitSeconds': '0',
+            'runSeconds': '0',
+            'report': {
+                'metrics': [{'id': id, 'name': id, 'type': 'number'} for id in metrics],
+                'elements': [{'id': element['id'], 'name': element['id']} for element in elements],
+                'period': description.get('date') or description.get('dateFrom'),
+                'segment_id': description.get('segment_id', ''),
+                'data': data,
+                },
+            }
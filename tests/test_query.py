@@ -0,0 +1,82 @@
+# encoding: utf-8
+
+import unittest
+import omniture
+from omniture import utils
+from omniture.elements import Value
+from tests import account
+
+
+class TestQuery(unittest.TestCase):
+    def setUp(self):
+        self.suite = account().suites['network']
+        self.base = self.suite.report.range('2013-05-01', '2013-05-31', granularity='day')
+
+    def test_chaining_does_not_modify_base(self):
+        raw = dict(self.base.raw)
+        self.base.ranked('pageviews', 'page').filter(segment='UK')
+        self.assertEqual(self.base.raw, raw)
+
+    def test_equal_regardless_of_order(self):
+        a = self.base.ranked(['Page Views'], self.suite.elements['page'].range(10))
+        b = self.suite.report \
+            .ranked('pageviews', 'Page') \
+            .set('elements', [self.suite.elements['page'].range(10)]) \
+            .range('2013-05-01', '2013-05-31', granularity='day')
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertEqual(len(set([a, b])), 1)
+
+    def test_report_type_is_part_of_identity(self):
+        ranked = self.base.ranked('pageviews', 'page')
+        trended = self.base.trended('pageviews', 'page')
+        self.assertEqual(ranked.raw, trended.raw)
+        self.assertNotEqual(ranked, trended)
+
+    def test_queueing_does_not_change_identity(self):
+        query = self.base.over_time('pageviews')
+        canonical = query.canonical()
+        query.queue()
+        self.assertEqual(query.canonical(), canonical)
+        self.assertNotIn('reportSuiteID', query.raw)
+
+    def test_element_copies(self):
+        page = self.suite.elements['page']
+        top = page.range(5)
+        self.assertEqual(top.properties, {'id': 'page', 'startingWith': '0', 'top': '5'})
+        self.assertEqual(page.properties, {'id': 'page'})
+        self.assertEqual(top.title, page.title)
+
+
+class TestAddressableList(unittest.TestCase):
+    def setUp(self):
+        self.values = utils.AddressableList([Value('A', 'a', None), Value('B', 'b', None)])
+
+    def test_lookup(self):
+        self.assertEqual(self.values['A'].id, 'a')
+        self.assertEqual(self.values['b'].title, 'B')
+        self.assertRaises(KeyError, lambda: self.values['c'])
+
+    def test_lookup_after_modification(self):
+        self.values['a']
+        self.values[0] = Value('C', 'c', None)
+        self.assertEqual(self.values['c'].title, 'C')
+        self.assertRaises(KeyError, lambda: self.values['a'])
+
+        self.values.append(Value('D', 'd', None))
+        self.values += [Value('E', 'e', None)]
+        self.assertIsInstance(self.values, utils.AddressableList)
+        self.assertEqual(self.values['D'].id, 'd')
+        self.assertEqual(self.values['E'].id, 'e')
+
+        del self.values[0]
+        self.assertRaises(KeyError, lambda: self.values['c'])
+
+    def test_lookup_after_renaming(self):
+        self.values['a']
+        self.values[0].title = 'C'
+        self.assertEqual(self.values['C'].id, 'a')
+
+
+if __name__ == '__main__':
+    unittest.main()
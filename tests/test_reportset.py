@@ -0,0 +1,75 @@
+# encoding: utf-8
+
+import unittest
+import numpy as np
+import omniture
+from tests import account
+
+
+class TestReportSet(unittest.TestCase):
+    def setUp(self):
+        self.suite = account().suites['network']
+
+    def over_time(self):
+        queries = {
+            'uk': self.suite.report.range('2013-05-03', '2013-05-05') \
+                .over_time('pageviews').filter(segment='UK'),
+            'us': self.suite.report.range('2013-05-01', '2013-05-04') \
+                .over_time('pageviews').filter(segment='US'),
+        }
+        return omniture.sync(queries, interval=0, combine=True)
+
+    def test_align_periods(self):
+        reports = self.over_time()
+        self.assertEqual(list(reports.keys), [
+            'Wed. 01 May 2013',
+            'Thu. 02 May 2013',
+            'Fri. 03 May 2013',
+            'Sat. 04 May 2013',
+            'Sun. 05 May 2013',
+            ])
+        uk = reports.labels.index('uk')
+        us = reports.labels.index('us')
+        values = reports.values('pageviews')
+        np.testing.assert_array_equal(values[uk], [np.nan, np.nan, 5, 6, 7])
+        np.testing.assert_array_equal(values[us], [3, 4, 5, 6, np.nan])
+        np.testing.assert_array_equal(reports.sum('pageviews'), [3, 4, 10, 12, 7])
+
+    def test_change(self):
+        reports = self.over_time()
+        uk = reports.labels.index('uk')
+        us = reports.labels.index('us')
+        change = reports.change('pageviews')
+        np.testing.assert_array_equal(change[uk], [np.nan, np.nan, np.nan, 1, 1])
+        np.testing.assert_array_equal(change[us], [np.nan, 1, 1, 1, np.nan])
+        relative = reports.change('pageviews', periods=2, relative=True)
+        np.testing.assert_array_equal(relative[us], [np.nan, np.nan, 2.0 / 3, 2.0 / 4, np.nan])
+        self.assertRaises(ValueError, reports.change, 'pageviews', 0)
+
+    def test_share_and_ratio(self):
+        reports = self.over_time()
+        us = reports.labels.index('us')
+        np.testing.assert_array_equal(reports.share('pageviews')[us], [1, 1, 0.5, 0.5, np.nan])
+        np.testing.assert_array_equal(reports.ratio('pageviews', 'pageviews')[us], [1, 1, 1, 1, np.nan])
+
+    def test_ranked_rows_with_the_same_name(self):
+        query = self.suite.report \
+            .range('2013-05-01') \
+            .ranked('pageviews', self.suite.elements['page'].range(36))
+        reports = omniture.sync([query], interval=0, combine=True)
+        self.assertIn(('home', '/'), list(reports.keys))
+        self.assertIn(('home', '/home'), list(reports.keys))
+        self.assertEqual(reports.sum('pageviews', axis=1)[0], sum(range(36)))
+        keys, values = reports.top('pageviews', 2)
+        self.assertEqual(list(keys[0]), [('home', '/home'), ('page 34', '/34')])
+        self.assertEqual(list(values[0]), [35, 34])
+
+    def test_duplicate_rows(self):
+        report = omniture.sync([self.suite.report.range('2013-05-01').over_time('pageviews')], interval=0)[0]
+        report.periods = report.periods * 2
+        report.keys = report.keys * 2
+        self.assertRaises(ValueError, omniture.ReportSet, [report])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+# encoding: utf-8
+
+import unittest
+import omniture
+from tests import account
+from tests.fakeapi import PAGES
+
+
+class TestRows(unittest.TestCase):
+    def setUp(self):
+        self.account = account(counting=True)
+        self.suite = self.account.suites['network']
+        self.methods = self.account.transport.methods
+        self.query = self.suite.report.range('2013-05-01').ranked('pageviews', 'page')
+
+    def test_report_rows(self):
+        report = self.suite.report.range('2013-05-01', '2013-05-02') \
+            .over_time(['pageviews', 'visits']).sync(interval=0)
+        self.assertEqual(list(report), [
+            {'name': 'Wed. 01 May 2013', 'pageviews': 1, 'visits': 0},
+            {'name': 'Thu. 02 May 2013', 'pageviews': 2, 'visits': 1},
+            ])
+
+    def test_empty_report(self):
+        page = self.suite.elements['page'].range(100, 110)
+        report = self.query.ranked('pageviews', page).sync(interval=0)
+        self.assertEqual(report.count, 0)
+        self.assertEqual(list(report), [])
+        self.assertTrue(report)
+
+    def test_iter_rows(self):
+        rows = list(self.query.iter_rows(size=5, prefetch=2, interval=0))
+        self.assertEqual([(row['name'], row['url']) for row in rows], PAGES)
+        self.assertEqual([row['pageviews'] for row in rows], range(len(PAGES)))
+        # eight windows to cover every row, two more prefetched and cancelled
+        self.assertEqual(self.methods.count('QueueRanked'), 10)
+        self.assertEqual(self.methods.count('CancelReport'), 2)
+
+    def test_iter_rows_honors_top(self):
+        page = self.suite.elements['page'].range(1, 21)
+        query = self.query.ranked('pageviews', page)
+        rows = list(query.iter_rows(size=6, interval=0))
+        self.assertEqual([row['url'] for row in rows], [url for name, url in PAGES[:20]])
+        self.assertEqual(self.methods.count('QueueRanked'), 4)
+        self.assertEqual(self.methods.count('CancelReport'), 0)
+
+    def test_iter_rows_from_zero(self):
+        # `Element.range(stop)` starts at 0, the API at 1
+        page = self.suite.elements['page'].range(10)
+        query = self.query.ranked('pageviews', page)
+        rows = list(query.iter_rows(size=3, interval=0))
+        self.assertEqual([row['url'] for row in rows], [url for name, url in PAGES[:10]])
+        self.assertEqual([row['url'] for row in query.sync(interval=0)], [row['url'] for row in rows])
+
+    def test_prefetch(self):
+        rows = self.query.iter_rows(size=5, prefetch=2, interval=0)
+        next(rows)
+        self.assertEqual(self.methods.count('QueueRanked'), 3)
+        for i in range(5):
+            next(rows)
+        # done with the first window, and two windows ahead of the second
+        self.assertEqual(self.methods.count('QueueRanked'), 4)
+
+    def test_no_prefetch(self):
+        rows = self.query.iter_rows(size=5, prefetch=0, interval=0)
+        next(rows)
+        self.assertEqual(self.methods.count('QueueRanked'), 1)
+        self.assertEqual(len(list(rows)), len(PAGES) - 1)
+        self.assertEqual(self.methods.count('CancelReport'), 0)
+
+    def test_close_cancels_pending(self):
+        rows = self.query.iter_rows(size=5, prefetch=2, interval=0)
+        next(rows)
+        rows.close()
+        self.assertEqual(self.methods.count('QueueRanked'), 3)
+        self.assertEqual(self.methods.count('CancelReport'), 2)
+
+    def test_ranked_rows_without_metrics(self):
+        report = self.query.sync(interval=0)
+        report.metrics = []
+        self.assertEqual([row['url'] for row in report], [url for name, url in PAGES[:10]])
+
+    def test_invalid(self):
+        over_time = self.suite.report.range('2013-05-01').over_time('pageviews')
+        self.assertRaises(ValueError, list, over_time.iter_rows())
+        self.assertRaises(ValueError, list, self.query.iter_rows(size=omniture.Query.MAX_ROWS + 1))
+        self.assertRaises(ValueError, list, self.query.iter_rows(size=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
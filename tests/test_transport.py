@@ -0,0 +1,82 @@
+# encoding: utf-8
+
+import os
+import shutil
+import tempfile
+import unittest
+import omniture
+from fakeapi import FakeAPI
+
+
+class TestTransport(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'traffic.json.gz')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def record(self, fn, **options):
+        transport = omniture.RecordingTransport(self.path, FakeAPI(pending=2), **options)
+        try:
+            return fn(omniture.Account(None, None, transport=transport))
+        finally:
+            transport.close()
+
+    def replay(self, fn):
+        transport = omniture.ReplayTransport(self.path)
+        return fn(omniture.Account(None, None, transport=transport))
+
+    def test_record_and_replay(self):
+        def run(account):
+            query = account.suites['network'].report \
+                .range('2013-05-01', '2013-05-03') \
+                .over_time(['pageviews', 'visits'])
+            report = query.sync(interval=0)
+            return report.keys, report.data['pageviews'], report.data['visits']
+
+        recorded = self.record(run)
+        self.assertEqual(self.replay(run), recorded)
+
+    def test_replay_polls_in_recorded_order(self):
+        def run(account):
+            suite = account.suites['network']
+            query = suite.report.range('2013-05-01').over_time('pageviews').queue()
+            return [suite.request('Report', 'GetStatus', {'reportID': query.id})['status']
+                for i in range(4)]
+
+        statuses = ['not ready', 'not ready', 'ready', 'ready']
+        self.assertEqual(self.record(run), statuses)
+        self.assertEqual(self.replay(run), statuses)
+
+    def test_missing_response(self):
+        self.record(lambda account: account.suites['network'].metrics)
+        with self.assertRaises(KeyError):
+            self.replay(lambda account: account.suites['network'].elements)
+
+    def test_rerecording_overwrites(self):
+        self.record(lambda account: account.suites['network'].metrics)
+        self.record(lambda account: account.suites['network'].elements)
+        self.replay(lambda account: account.suites['network'].elements)
+        with self.assertRaises(KeyError):
+            self.replay(lambda account: account.suites['network'].metrics)
+
+    def test_append(self):
+        self.record(lambda account: account.suites['network'].metrics)
+        self.record(lambda account: account.suites['network'].elements, append=True)
+        self.replay(lambda account: account.suites['network'].metrics)
+        self.replay(lambda account: account.suites['network'].elements)
+
+    def test_archive_is_compact(self):
+        def run(account):
+            for i in range(2000):
+                account.request('Company', 'GetReportSuites', {'page': i})
+
+        # 2000 records of ~150 bytes each compress to a few kilobytes
+        # when written out as a single stream
+        self.record(run)
+        self.assertLess(os.path.getsize(self.path), 20000)
+
+
+if __name__ == '__main__':
+    unittest.main()